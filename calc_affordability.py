@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+import numpy as np
 
 # Constants
 FHA_RATE = 0.0615  # 6.15%
@@ -24,47 +27,51 @@ roles = [
     {'role': 'Ops/Admin/Eng', 'base': 80000, 'ote': 90000, 'count': 12} 
 ]
 
-def calc_max_price(annual_income, rate, dti, down_payment_pct):
-    monthly_gross = annual_income / 12
-    max_monthly_payment = monthly_gross * dti
-    
+@lru_cache(maxsize=32)
+def _denominator(rate, down_payment_pct):
     r_monthly = rate / 12
     n_months = 360
-    
-    mortgage_factor = (r_monthly * (1 + r_monthly)**n_months) / ((1 + r_monthly)**n_months - 1)
-    denominator = (1 - down_payment_pct) * mortgage_factor + (TAX_INS_HOA_RATE / 12)
-    
-    max_price = max_monthly_payment / denominator
-    return max_price
+
+    growth = (1 + r_monthly)**n_months
+    mortgage_factor = (r_monthly * growth) / (growth - 1)
+    return (1 - down_payment_pct) * mortgage_factor + (TAX_INS_HOA_RATE / 12)
+
+def calc_max_price(annual_income, rate, dti, down_payment_pct):
+    max_monthly_payment = (annual_income / 12) * dti
+    return max_monthly_payment / _denominator(rate, down_payment_pct)
 
 header = "{:<20} | {:<20} | {:<10} | {:<12} | {:<20}".format("Role", "Scenario", "Income", "Max Price", "Affordable")
 print(header)
 print('-'*100)
 
+# Flatten roles x household scenarios into one income vector
+rows = []
 for r in roles:
     scenarios = [
         {'name': 'Single (Base)', 'income': r['base']},
         {'name': 'Single (OTE)', 'income': r['ote']},
         {'name': 'Dual Income (+60k)', 'income': r['ote'] + 60000}
     ]
-    
     for s in scenarios:
-        price = calc_max_price(s['income'], FHA_RATE, DTI_LIMIT, 0.035)
-        
-        if price > FHA_LIMIT:
-            price = calc_max_price(s['income'], CONV_RATE, DTI_LIMIT, 0.10)
-            
-        matches = []
-        for p_name, p_data in products.items():
-            if p_data['type'] == 'Buy':
-                if price >= p_data['range'][0]:
-                    matches.append(p_name)
-            else:
-                if (s['income'] / 12) * 0.35 >= p_data['range'][0]:
-                     matches.append(p_name) # Removed (Rent) suffix for brevity
+        rows.append((r['role'], s['name'], s['income']))
+
+incomes = np.array([income for _, _, income in rows], dtype=float)
+
+price_fha = calc_max_price(incomes, FHA_RATE, DTI_LIMIT, 0.035)
+price_conv = calc_max_price(incomes, CONV_RATE, DTI_LIMIT, 0.10)
+prices = np.where(price_fha > FHA_LIMIT, price_conv, price_fha)
+
+product_masks = {}
+for p_name, p_data in products.items():
+    if p_data['type'] == 'Buy':
+        product_masks[p_name] = prices >= p_data['range'][0]
+    else:
+        product_masks[p_name] = (incomes / 12) * 0.35 >= p_data['range'][0]
 
-        row = "{:<20} | {:<20} | ${:<9} | ${:<11} | {}".format(
-            r['role'], s['name'], s['income'], int(price), ', '.join(matches)
-        )
-        print(row)
+for i, (role_name, scenario_name, income) in enumerate(rows):
+    matches = [p_name for p_name, mask in product_masks.items() if mask[i]]
 
+    row = "{:<20} | {:<20} | ${:<9} | ${:<11} | {}".format(
+        role_name, scenario_name, income, int(prices[i]), ', '.join(matches)
+    )
+    print(row)
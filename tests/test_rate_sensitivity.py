@@ -0,0 +1,18 @@
+import json
+from pathlib import Path
+
+import rate_sensitivity
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def test_generate_test_outputs_matches_tracked(tmp_path, monkeypatch):
+    (tmp_path / "data").symlink_to(REPO / "data")
+    monkeypatch.chdir(tmp_path)
+    rate_sensitivity.generate_test_outputs()
+
+    generated = sorted((tmp_path / "test_outputs").glob("*.json"))
+    assert generated
+    for path in generated:
+        tracked = REPO / "test_outputs" / path.name
+        assert json.loads(path.read_text()) == json.loads(tracked.read_text()), path.name
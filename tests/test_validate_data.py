@@ -0,0 +1,116 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+import validate_data
+
+FIXTURES = Path(__file__).with_name("fixtures")
+
+
+def _fixture_companies():
+    """(filename, company) for every company in the malformed fixtures."""
+    for path in sorted((FIXTURES / "malformed").glob("*.json")):
+        data = json.loads(path.read_text())
+        for i, company in enumerate(data.get("companies", [data])):
+            yield f"{path.name}[{i}]", company
+
+
+# One-field edits that push an otherwise valid role onto or past a rule's edge
+_ROLE_EDITS = [
+    ("count", 0), ("count", -1), ("count", 1.5), ("count", True),
+    ("base_salary", 24999), ("base_salary", 25000), ("base_salary", 500000), ("base_salary", 500001),
+    ("base_salary", 60000.0), ("ote", 24999), ("ote", 1000000), ("ote", 1000001), ("ote", 30000),
+    ("is_entry_level", "yes"), ("title", 7),
+    ("household_split", {"H1_single": 0.5, "H2_dual_moderate": 0.5, "H3_dual_peer": 0.011}),
+    ("household_split", {"H1_single": 0.5, "H2_dual_moderate": 0.5, "H3_dual_peer": 0.01}),
+    ("household_split", {"H1_single": 1.0, "H2_dual_moderate": 0.0, "H3_dual_peer": 0.0, "H4": 0.0}),
+    ("household_split", {"H1_single": 1.0, "H2_dual_moderate": 0.0}),
+    ("household_split", {"H1_single": 1.5, "H2_dual_moderate": -0.5, "H3_dual_peer": 0.0}),
+]
+
+
+def _mostly_valid_role(rng: random.Random) -> dict:
+    """A role that passes every per-field check, then maybe gets one edge-case edit."""
+    role = {
+        "title": rng.choice(["AE", "SDR", "CSM"]),
+        "count": rng.randint(1, 40),
+        "base_salary": rng.randint(40000, 200000),
+        "ote": rng.randint(40000, 300000),
+        "is_entry_level": rng.choice([True, False]),
+        "segment_type": "sales",
+        "household_split": {"H1_single": 0.5, "H2_dual_moderate": 0.3, "H3_dual_peer": 0.2},
+    }
+    roll = rng.random()
+    if roll < 0.3:
+        field, value = rng.choice(_ROLE_EDITS)
+        role[field] = value
+    elif roll < 0.35:
+        del role[rng.choice(validate_data.ROLE_FIELD_ORDER)]
+    return role
+
+
+def test_role_screen_matches_per_role_loop(monkeypatch):
+    rng = random.Random(2)
+    edits = _ROLE_EDITS + [("base_salary", 500000.5), ("ote", 1000000.5), ("count", 1e-300)] + [
+        ("household_split", {"H1_single": bad, "H2_dual_moderate": 0.5, "H3_dual_peer": 0.5})
+        for bad in (float("nan"), float("inf"), float("-inf"))
+    ]
+    companies = []
+    for i in range(200):
+        roles = [_mostly_valid_role(rng) for _ in range(rng.randint(0, 40))]
+        for field, value in rng.sample(edits, rng.randint(1, 4)):
+            role = _mostly_valid_role(rng)
+            role[field] = value
+            roles.append(role)
+        rng.shuffle(roles)
+        roles += [_mostly_valid_role(rng) for _ in range(validate_data.VECTORIZE_MIN_ROLES - len(roles))]
+        companies.append((f"random[{i}]", {"name": "Random", "base_year": 2025,
+                                           "employee_count": 100, "roles": roles}))
+
+    screened = [[str(e) for e in validate_data.validate_company(c, f)] for f, c in companies]
+    monkeypatch.setattr(validate_data, "VECTORIZE_MIN_ROLES", float("inf"))
+    looped = [[str(e) for e in validate_data.validate_company(c, f)] for f, c in companies]
+    assert screened == looped
+
+
+def _random_company(rng: random.Random) -> dict:
+    company = {
+        "name": "Random",
+        "base_year": rng.choice([2019, 2020, 2025, 2030, 2031]),
+        "employee_count": rng.choice([0, 5, 40, 100]),
+        "roles": [_mostly_valid_role(rng) for _ in range(rng.randint(0, 4))],
+    }
+    if rng.random() < 0.3:
+        company["projection_years"] = rng.choice(
+            [[{"year": 2026, "employee_count": 120}], [{"year": 2026}], {"2026": 120}]
+        )
+    return company
+
+
+def _assert_fast_path_matches_legacy():
+    rng = random.Random(1)
+    companies = list(_fixture_companies())
+    companies += [(f"random[{i}]", _random_company(rng)) for i in range(2000)]
+    matched = 0
+    for filename, company in companies:
+        fast = [str(e) for e in validate_data._check_company(company, filename)]
+        legacy = [str(e) for e in validate_data._check_company(company, filename, legacy=True)]
+        assert fast == legacy, filename
+        matched += validate_data._matches_schema(company)
+    assert matched, "no company took the schema fast path"
+
+
+def test_msgspec_fast_path_matches_legacy():
+    pytest.importorskip("msgspec")
+    _assert_fast_path_matches_legacy()
+
+
+def test_fastjsonschema_fast_path_matches_legacy(monkeypatch):
+    fastjsonschema = pytest.importorskip("fastjsonschema")
+    schema = json.loads(validate_data.SCHEMA_PATH.read_text())
+    monkeypatch.setattr(validate_data, "msgspec", None)
+    monkeypatch.setattr(validate_data, "fastjsonschema", fastjsonschema)
+    monkeypatch.setattr(validate_data, "_schema_validator", fastjsonschema.compile(schema))
+    _assert_fast_path_matches_legacy()